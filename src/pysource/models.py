@@ -7,7 +7,7 @@ from devito import (Grid, Function, SubDimension, Eq, Inc, switchconfig,
                     Operator, mmin, mmax, initialize_function,
                     Abs, sqrt, sin, Constant, CustomDimension)
 
-from devito.tools import as_tuple, memoized_func
+from devito.tools import memoized_func
 
 try:
     from devitopro import *  # noqa
@@ -96,8 +96,54 @@ def damp_op(ndim, padsizes, abc_type, fs):
     return Operator(eqs, name='initdamp')
 
 
+def damp_layer(nb):
+    """
+    Damping profile of an absorbing layer of `nb` points, ordered from the
+    outer boundary toward the physical domain.
+
+    Parameters
+    ----------
+    nb : int
+        Number of points in the damping layer.
+    """
+    # 3 Point buffer to avoid weird interaction with abc
+    nb = nb - 3
+    dampcoeff = 1.5 * np.log(1.0 / 0.001) / (nb)
+    pos = np.abs((nb - np.arange(nb) + 1) / float(nb))
+    return dampcoeff * (pos - np.sin(2*np.pi*pos)/(2*np.pi))
+
+
+@memoized_func
+def cfl_coeff(space_order, is_elastic, ndim):
+    """
+    Courant number from the physics and spatial discretization order.
+    The CFL coefficients are described in:
+    - https://doi.org/10.1137/0916052 for the elastic case
+    - https://library.seg.org/doi/pdf/10.1190/1.1444605 for the acoustic case
+
+    Parameters
+    ----------
+    space_order : int
+        Order of the spatial stencil discretisation.
+    is_elastic : bool
+        Whether the physics is elastic or acoustic.
+    ndim : int
+        Number of dimensions in the model.
+    """
+    # Elasic coefficient (see e.g )
+    if is_elastic:
+        so = max(space_order // 2, 2)
+        coeffs = fd_w(1, range(-so, so), .5)
+        c_fd = sum(np.abs(coeffs[-1][-1])) / 2
+        return .9 * np.sqrt(ndim) / ndim / c_fd
+    a1 = 4  # 2nd order in time
+    so = max(space_order // 2, 4)
+    coeffs = fd_w(2, range(-so, so), 0)[-1][-1]
+    return .9 * np.sqrt(a1/float(ndim * sum(np.abs(coeffs))))
+
+
 @switchconfig(log_level='ERROR')
-def initialize_damp(damp, padsizes, abc_type="damp", fs=False):
+def initialize_damp(damp, padsizes, abc_type="damp", fs=False, symbolic=False):
     """
     Initialise damping field with an absorbing boundary layer.
     Includes basic constant Q setup (not interfaced yet) and assumes that
@@ -107,17 +153,39 @@ def initialize_damp(damp, padsizes, abc_type="damp", fs=False):
     ----------
     damp : Function
         The damping field for absorbing boundary condition.
-    nbl : int
-        Number of points in the damping layer.
-    spacing :
-        Grid spacing coefficient.
-    mask : bool, optional
+    padsizes : List of tuple
+        Number of points in the damping layer for each dimension and side.
+    abc_type : mask or damp
         whether the dampening is a mask or layer.
         mask => 1 inside the domain and decreases in the layer
-        not mask => 0 inside the domain and increase in the layer
+        damp => 0 inside the domain and increase in the layer
+    fs: bool
+        Whether the model is with free surface or not
+    symbolic: bool
+        Whether to initialize the damping field with a devito Operator rather
+        than directly with numpy. Defaults to False
     """
-    op = damp_op(damp.grid.dim, padsizes, abc_type, fs)
-    op(damp=damp)
+    if symbolic:
+        op = damp_op(damp.grid.dim, padsizes, abc_type, fs)
+        op(damp=damp)
+        return
+
+    # Only fill the local (MPI rank) portion of the damping field
+    sign = -1 if abc_type == "mask" else 1
+    data = damp.data._local
+    data.fill(1.0 if abc_type == "mask" else 0.0)
+    grid = damp.grid
+    for i, ((nbl, nbr), d) in enumerate(zip(padsizes, damp.dimensions)):
+        n = grid.shape[i]
+        profile = np.zeros(n)
+        if not fs or d is not damp.dimensions[-1]:
+            val = damp_layer(nbl)
+            profile[:val.size] += val
+        val = damp_layer(nbr)
+        profile[n-val.size:] += val[::-1]
+        bshape = [1] * grid.dim
+        bshape[i] = -1
+        data += sign * profile[damp.local_indices[i]].reshape(bshape) / grid.spacing[i]
 
 
 class Model(object):
@@ -217,8 +285,10 @@ class Model(object):
         if self._is_tti:
             epsilon = 1 if epsilon is None else 1 + 2 * to_numpy(epsilon)
             delta = 1 if delta is None else 1 + 2 * to_numpy(delta)
-            self.epsilon = self._gen_phys_param(epsilon, 'epsilon', space_order)
-            self.scale = np.sqrt(np.max(epsilon))
+            emax = np.amax(epsilon)
+            self.epsilon = self._gen_phys_param(epsilon, 'epsilon', space_order,
+                                                vmax=emax)
+            self.scale = np.sqrt(emax)
             self.delta = self._gen_phys_param(delta, 'delta', space_order)
             self.theta = self._gen_phys_param(theta, 'theta', space_order)
             if self.grid.dim == 3:
@@ -255,7 +325,9 @@ class Model(object):
         if rho is not None:
             rm, rM = np.amin(rho), np.amax(rho)
             if rm/rM > .1:
-                self.irho = self._gen_phys_param(np.reciprocal(rho), 'irho', so)
+                dtype = np.result_type(np.asarray(rho).dtype, np.float16)
+                irho = np.divide(1, rho, out=np.empty(np.shape(rho), dtype=dtype))
+                self.irho = self._gen_phys_param(irho, 'irho', so)
                 self.rho = 1 / self.irho
             else:
                 self.rho = self._gen_phys_param(rho, 'rho', so)
@@ -265,12 +337,19 @@ class Model(object):
         else:
             self.irho = 1
 
-    @property
+    @cached_property
     def padsizes(self):
         padsizes = [(self.nbl, self.nbl) for _ in range(self.dim-1)]
         padsizes.append((0 if self.fs else self.nbl, self.nbl))
         return tuple(p for p in padsizes)
 
+    @cached_property
+    def _padsizes_left(self):
+        """
+        Number of padding points on the left side of each dimension
+        """
+        return np.array([p[0] for p in self.padsizes], dtype=np.float32)
+
     def physical_params(self, **kwargs):
         """
         Return all set physical parameters and update to input values if provided
@@ -287,7 +366,7 @@ class Model(object):
 
         return params
 
-    @property
+    @cached_property
     def zero_thomsen(self):
         out = {}
         for (t, v) in _thomsen:
@@ -299,9 +378,10 @@ class Model(object):
 
     @switchconfig(log_level='ERROR')
     def _gen_phys_param(self, field, name, space_order, is_param=False,
-                        default_value=0, avg_mode='arithmetic'):
+                        default_value=0, avg_mode='arithmetic', vmax=None):
         """
-        Create symbolic object an initialize its data
+        Create symbolic object an initialize its data.
+        `vmax` is the maximum of `field` if already known by the caller.
         """
         if field is None:
             return default_value
@@ -309,7 +389,7 @@ class Model(object):
             dtype = np.dtype(field.__array_interface__['typestr']).type
             if _dtypes['params'] == 'f16' or dtype == np.float16:
                 _min = np.amin(field)
-                _max = np.amax(field)
+                _max = np.amax(field) if vmax is None else vmax
                 if _max == _min:
                     _max = .125 if _min == 0 else _min * 1.125
                 dtype = Float16(_min, _max)
@@ -318,14 +398,25 @@ class Model(object):
 
             function = Function(name=name, grid=self.grid, space_order=space_order,
                                 parameter=is_param, avg_mode=avg_mode, dtype=dtype)
-            pad = 0 if field.shape == function.shape else self.padsizes
+            # Already padded fields are copied as is. They cannot be used as the
+            # Function's storage since its allocation includes the halo
+            if field.shape == self.grid.shape:
+                pad = 0
+            elif field.shape == self.shape:
+                pad = self.padsizes
+            else:
+                raise ValueError("Shape of %s %s does not match the model shape %s "
+                                 "with or without padding" %
+                                 (name, field.shape, self.shape))
             initialize_function(function, to_numpy(field), pad)
         else:
             function = Constant(name=name, value=np.amin(field))
         self._physical_parameters.append(name)
+        # Reset cached list of parameters
+        self.__dict__.pop('physical_parameters', None)
         return function
 
-    @property
+    @cached_property
     def physical_parameters(self):
         """
         List of physical parameteres
@@ -347,37 +438,37 @@ class Model(object):
                 params.append(('%s_const' % p, dtype))
             else:
                 params.append((p, dtype))
-        return as_tuple(params)
+        return tuple(params)
 
-    @property
+    @cached_property
     def dim(self):
         """
         Spatial dimension of the problem and model domain.
         """
         return self.grid.dim
 
-    @property
+    @cached_property
     def spacing(self):
         """
         Grid spacing for all fields in the physical model.
         """
         return self.grid.spacing
 
-    @property
+    @cached_property
     def space_dimensions(self):
         """
         Spatial dimensions of the grid
         """
         return self.grid.dimensions
 
-    @property
+    @cached_property
     def dtype(self):
         """
         Data type for all assocaited data objects.
         """
         return self.grid.dtype
 
-    @property
+    @cached_property
     def domain_size(self):
         """
         Physical size of the domain as determined by shape and spacing
@@ -404,6 +495,7 @@ class Model(object):
         Set user provided dt to overwrite the default CFL value.
         """
         self._dt = dt
+        self.__dict__.pop('critical_dt', None)
 
     @property
     def is_tti(self):
@@ -426,7 +518,7 @@ class Model(object):
         """
         return self._is_elastic
 
-    @property
+    @cached_property
     def _max_vp(self):
         """
         Maximum velocity
@@ -440,29 +532,17 @@ class Model(object):
     def _cfl_coeff(self):
         """
         Courant number from the physics and spatial discretization order.
-        The CFL coefficients are described in:
-        - https://doi.org/10.1137/0916052 for the elastic case
-        - https://library.seg.org/doi/pdf/10.1190/1.1444605 for the acoustic case
         """
-        # Elasic coefficient (see e.g )
-        if self.is_elastic:
-            so = max(self.space_order // 2, 2)
-            coeffs = fd_w(1, range(-so, so), .5)
-            c_fd = sum(np.abs(coeffs[-1][-1])) / 2
-            return .9 * np.sqrt(self.dim) / self.dim / c_fd
-        a1 = 4  # 2nd order in time
-        so = max(self.space_order // 2, 4)
-        coeffs = fd_w(2, range(-so, so), 0)[-1][-1]
-        return .9 * np.sqrt(a1/float(self.grid.dim * sum(np.abs(coeffs))))
+        return cfl_coeff(self.space_order, self.is_elastic, self.grid.dim)
 
-    @property
+    @cached_property
     def _thomsen_scale(self):
         # Update scale for tti
         if self.is_tti:
             return np.sqrt(1 + 2 * getmax(self.epsilon))
         return 1
 
-    @property
+    @cached_property
     def critical_dt(self):
         """
         Critical computational time step value from the CFL condition.
@@ -481,7 +561,7 @@ class Model(object):
                 return self.dtype("%.3e" % self.dt)
         return dt
 
-    @property
+    @cached_property
     def vp(self):
         """
         Symbolic representation of the velocity
@@ -550,19 +630,18 @@ class EmptyModel(Model):
         p_params = {k: v for k, v in p_params if k != 'damp'}
         # Create the function for the physical parameters
         self.damp = Function(name='damp', grid=self.grid, space_order=0)
-        _physical_parameters = ['damp']
-        for p, dt in p_params.items():
-            if _dtypes['params'] == 'f16':
-                dt = np.float16
-            if p.endswith('_const'):
-                name = p.split('_')[0]
-                setattr(self, name, Constant(name=name, value=1, dtype=dt))
-            else:
-                avgmode = 'harmonic' if p == 'mu' else 'arithmetic'
-                setattr(self, p, Function(name=p, grid=self.grid, is_param=True,
-                                          space_order=space_order, dtype=dt,
-                                          avg_mode=avgmode))
-                _physical_parameters.append(p)
+        if _dtypes['params'] == 'f16':
+            p_params = {k: np.float16 for k in p_params}
+        consts = [(p[:-6], dt) for p, dt in p_params.items() if p.endswith('_const')]
+        funcs = [(p, dt) for p, dt in p_params.items() if not p.endswith('_const')]
+        for name, dt in consts:
+            setattr(self, name, Constant(name=name, value=1, dtype=dt))
+        for p, dt in funcs:
+            avgmode = 'harmonic' if p == 'mu' else 'arithmetic'
+            setattr(self, p, Function(name=p, grid=self.grid, is_param=True,
+                                      space_order=space_order, dtype=dt,
+                                      avg_mode=avgmode))
+        _physical_parameters = ['damp'] + [p for p, _ in funcs]
         if 'irho' not in p_params and 'irho_const' not in p_params:
             self.irho = 1 if 'rho' not in p_params else 1 / self.rho
 
@@ -575,7 +654,7 @@ class EmptyModel(Model):
         """
         return self.grid.time_dim.spacing
 
-    @property
+    @cached_property
     def zero_thomsen(self):
         out = {}
         for (t, v) in _thomsen:
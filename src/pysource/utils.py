@@ -4,13 +4,14 @@ except ImportError:
     from collections import Iterable
 
 import os
+import shutil
 import numpy as np
 from sympy import sqrt
 
 from devito import configuration
 from devito.arch import Device
 from devito.arch.compiler import NvidiaCompiler, CudaCompiler
-from devito.tools import as_tuple
+from devito.tools import as_tuple, frozendict, memoized_func
 
 try:
     import devitopro as dvp
@@ -54,11 +55,11 @@ def weight_srcfocus(model, src_coords, delta=.01, full=True):
         Reference distance for weights
     """
     w_dim = as_tuple(model.grid.dimensions if full else model.grid.dimensions[-1])
-    isrc = tuple(np.float32(model.padsizes[i][0]) + src_coords[0, i] / model.spacing[i]
-                 for i in range(model.dim))
+    isrc = model._padsizes_left + src_coords[0, :model.dim] / model.spacing
     h = np.prod(model.spacing)**(1/model.dim)
+    delta_h = delta / h
     radius = sum((d - isrc[i])**2 for i, d in enumerate(w_dim))
-    return sqrt(radius + (delta / h)**2) / (delta/h)
+    return sqrt(radius + delta_h**2) / delta_h
 
 
 def compute_optalpha(norm_r, norm_Fty, epsilon, comp_alpha=True):
@@ -77,6 +78,11 @@ def compute_optalpha(norm_r, norm_Fty, epsilon, comp_alpha=True):
         Whether to compute the optimal alpha or just return 1
     """
     if comp_alpha:
+        # Elementwise over arrays of norms, masking instead of branching
+        if np.ndim(norm_r) or np.ndim(norm_Fty):
+            valid = (norm_r > epsilon) & (norm_Fty > 0)
+            return np.where(valid, norm_r * (norm_r - epsilon) /
+                            np.where(valid, norm_Fty, 1), 0)
         if norm_r > epsilon and norm_Fty > 0:
             return norm_r * (norm_r - epsilon) / norm_Fty
         else:
@@ -95,14 +101,23 @@ def opt_op(model):
     model: Model
         Model structure to know if we are in a TTI model
     """
-    if isinstance(configuration['platform'], Device):
-        opts = {'openmp': True if configuration['language'] == 'openmp' else None,
-                'mpi': configuration['mpi']}
+    is_device = isinstance(configuration['platform'], Device)
+    return _opt_op(is_device, configuration['language'], configuration['mpi'])
+
+
+@memoized_func
+def _opt_op(is_device, language, mpi):
+    """
+    Compiler options for a given platform type, language and mpi mode.
+    The options are frozen as they are shared between operators.
+    """
+    if is_device:
+        opts = {'openmp': True if language == 'openmp' else None, 'mpi': mpi}
         mode = 'advanced'
     else:
-        opts = {'openmp': True, 'par-collapse-ncores': 2, 'mpi': configuration['mpi']}
+        opts = {'openmp': True, 'par-collapse-ncores': 2, 'mpi': mpi}
         mode = 'advanced'
-    return (mode, opts)
+    return (mode, frozendict(opts))
 
 
 def nfreq(freq_list):
@@ -120,14 +135,13 @@ def fields_kwargs(*args):
     for field in args:
         if field is not None:
             # In some case could be a tuple of fields, such as dft modes
-            if isinstance(field, Iterable):
+            if type(field) in (list, tuple) or isinstance(field, Iterable):
                 kw.update(fields_kwargs(*field))
+            # Tensor and vector fields
+            elif callable(getattr(field, 'flat', None)):
+                kw.update({f.name: f for f in field.flat()})
             else:
-                try:
-                    kw.update({f.name: f for f in field.flat()})
-                    continue
-                except AttributeError:
-                    kw.update({field.name: field})
+                kw.update({field.name: field})
 
     return kw
 
@@ -146,8 +160,8 @@ def cleanup_wf(u):
     for ui in as_tuple(u):
         try:
             serialized = ui._parent._fnames
-            basedir = '/'.join(str(serialized[0]).split('/')[:-1])
-            os.system('rm -rf %s' % basedir)
+            basedir = os.path.dirname(str(serialized[0]))
+            shutil.rmtree(basedir, ignore_errors=True)
         except AttributeError:
             continue
 
@@ -164,7 +178,6 @@ def compression_mode():
 
 def npdot(a, b):
     """
-    Inner product of n-dimensional ndarrays through numpy einsum
+    Inner product of n-dimensional ndarrays through BLAS dot on flattened arrays
     """
-    inds = 'ijklm'[:len(a.shape)]
-    return np.einsum('%s,%s->' % (inds, inds), a, b)
+    return np.dot(np.ravel(a), np.ravel(b))